@@ -1,53 +1,187 @@
-from pulp import LpProblem, LpVariable, lpSum, LpMaximize, LpBinary, PULP_CBC_CMD
+import numpy as np
+from pulp import LpProblem, LpVariable, LpAffineExpression, LpMaximize, LpBinary, PULP_CBC_CMD, HiGHS, HiGHS_CMD
+
+
+
+def auction(matrix):
+    # Bertsekas' auction algorithm: every row (mentor) repeatedly bids for its
+    # best column (mentee) at the current prices, outbidding the previous owner
+    # by at least eps. With integer scores and eps below 1/(n+1) the final
+    # assignment is exactly optimal.
+    n_rows, n_cols = matrix.shape
+    eps = 1.0 / (n_cols + 1)
+    prices = np.zeros(n_cols)
+    owner = np.full(n_cols, -1)
+    assigned = np.full(n_rows, -1)
+    unassigned = list(range(n_rows))
+
+    while unassigned:
+        r = unassigned.pop()
+        values = matrix[r] - prices
+        best = int(np.argmax(values))
+        if n_cols > 1:
+            second = np.partition(values, -2)[-2]
+        else:
+            second = values[best]
+        prices[best] += values[best] - second + eps
+        previous = owner[best]
+        owner[best] = r
+        assigned[r] = best
+        if previous >= 0:
+            unassigned.append(previous)
+
+    rows = np.arange(n_rows)
+    return rows, assigned
+
+
+
+def assignment(mentee_choice, mentor_choice, scores):
+    # Solve the pure assignment case (every mentor gets exactly one mentee) with
+    # the auction algorithm instead of the ILP. Returns None when the instance
+    # does not fit the fast path so the caller falls back to the ILP.
+    mentees = list(mentee_choice)
+    mentors = list(mentor_choice)
+    if len(mentors) > len(mentees):
+        return None
+
+    mentee_index = {i: c for c, i in enumerate(mentees)}
+    mentor_index = {j: r for r, j in enumerate(mentors)}
+    matrix = np.zeros((len(mentors), len(mentees)))
+    for (i, j), s in scores.items():
+        matrix[mentor_index[j], mentee_index[i]] = s
+
+    rows, cols = auction(matrix)
+
+    # A zero-score pair in the optimum would be forbidden in the ILP, where such
+    # variables do not exist; hand those instances back to the ILP.
+    picked = matrix[rows, cols]
+    if (picked == 0).any():
+        return None
+
+    solution = {(mentees[c], mentors[r]): matrix[r, c] for r, c in zip(rows, cols)}
+    return picked.sum(), solution
+
+
+
+def build(mentee_choice, mentor_choice, uni_students, scores, max_student, uni_capacity):
+    # Build the ILP once and return it with its pair list and variable array, so
+    # repeated solves (parameter sweeps, warm starts, new time limits) do not
+    # pay the model-construction cost again.
 
+    #Initialize a minimization problem
+    problem = LpProblem("Mentor_Mentee_Matching", LpMaximize)
 
 
-def matching(mentee_choice, mentor_choice, uni_students, scores, max_student, uni_capacity, time):
+    # Keep only the pairs whose interests overlap. Constraint (5) used to force x_ij = 0
+    # whenever the score is zero, so those variables can be dropped from the model instead.
+    # The surviving scores go into an array aligned with 'pairs' so the objective and
+    # the solution assembly never go back to the dict.
+    pairs = []
+    pair_scores = []
+    for pair, s in scores.items():
+        if s > 0:
+            pairs.append(pair)
+            pair_scores.append(s)
+    pair_scores = np.array(pair_scores)
+
+
+    # Create decision variable x_ij for every pair with a positive score, stored
+    # in a NumPy object array so the buckets below can fancy-index into it.
+    variables = LpVariable.dicts("x", pairs, cat=LpBinary)
+    decision = np.array([variables[pair] for pair in pairs], dtype=object)
+
+
+    # Group the pair indices by mentor, by mentee and by uni in one pass; the
+    # uni of each student comes from a reverse map built once, so the uni rows
+    # no longer need a second sweep over uni_students and by_mentee.
+    mentees = list(mentee_choice)
+    mentors = list(mentor_choice)
+    uni_of = {student: uni for uni, students in uni_students.items() for student in students}
+    by_mentor = {j: [] for j in mentors}
+    by_mentee = {i: [] for i in mentees}
+    by_uni = {uni: [] for uni in uni_students.keys()}
+    for k, (i, j) in enumerate(pairs):
+        by_mentor[j].append(k)
+        by_mentee[i].append(k)
+        if i in uni_of:
+            by_uni[uni_of[i]].append(k)
+
+
+    # Every row gets a name so a reused model can be edited in place through
+    # problem.constraints (e.g. changeRHS on 'mentor_max_j' during a sweep over
+    # max_student, or del to drop a row) instead of rebuilding the problem.
+
+    # Constraint (2): each mentor receives at least one mentees, at most 'max_student' mentees.
+    for j in mentors:
+        row = LpAffineExpression([(v, 1) for v in decision[by_mentor[j]]])
+        problem += (row >= 1, f"mentor_min_{j}")
+        problem += (row <= max_student, f"mentor_max_{j}")
 
 
-    #Initialize a minimization problem
-    problem = LpProblem("Mentor_Mentee_Matching", LpMaximize)
+    # Constraint (3): each mentee is assigned to at most one mentor.
+    for i in mentees:
+        problem += (LpAffineExpression([(v, 1) for v in decision[by_mentee[i]]]) <= 1, f"mentee_{i}")
 
 
-    # Create decision variable x_ij for every mentee i and mentor j
-    decision = {(i, j): LpVariable(f"x_{i}_{j}", cat="Binary") for i in mentee_choice.keys() for j in mentor_choice.keys()}
+    # Constraint (4): at most 'uni_capacity' mentees are assigned from every uni.
+    for uni in uni_students.keys():
+        problem += (LpAffineExpression([(v, 1) for v in decision[by_uni[uni]]]) <= uni_capacity, f"uni_{uni}")
 
 
-    # Constraint (2): each mentor receives at least one mentees, at most 'max_student' mentees. 
-    for j in mentor_choice.keys():
-        problem += lpSum(decision[i, j] for i in mentee_choice.keys()) >= 1
-        problem += lpSum(decision[i, j] for i in mentee_choice.keys()) <= max_student
+    # Objective function: the total assignment score is maximized.
+    problem += LpAffineExpression(list(zip(decision, pair_scores)))
 
+    return problem, pairs, decision, pair_scores
 
-    # Constraint (3): each mentee is assigned to at most one mentor.
-    for i in mentee_choice.keys():
-        problem += lpSum(decision[i, j] for j in mentor_choice.keys()) <= 1
 
 
-    # Constraint (4): at most 'uni_capacity' mentees are assigned from every uni.
-    for uni in uni_students.keys():
-        problem += lpSum(decision[i, j] for i in uni_students[uni] for j in mentor_choice.keys()) <= uni_capacity
+def matching(mentee_choice, mentor_choice, uni_students, scores, max_student, uni_capacity, time, solver="highs", initial=None, threads=None, built=None, gap=None):
 
 
-    # Constraint (5): mentee i is assigned to mentor j only if their interests overlap.
-    for i in mentee_choice.keys():
-        for j in mentor_choice.keys():
-            problem += decision[i, j] <= decision[i, j]*scores[(i,j)]
+    # Fast path: when each mentor takes exactly one mentee and no uni can exceed
+    # its capacity, the model is a plain assignment problem.
+    if built is None and max_student == 1 and all(len(students) <= uni_capacity for students in uni_students.values()):
+        result = assignment(mentee_choice, mentor_choice, scores)
+        if result is not None:
+            return result
 
 
-    # Objective function: the total assignment score is maximized.
-    problem += lpSum(decision[i, j]*scores[(i,j)] for i in mentee_choice.keys() for j in mentor_choice.keys())
+    # Reuse a model from an earlier build() call when one is passed in
+    if built is None:
+        built = build(mentee_choice, mentor_choice, uni_students, scores, max_student, uni_capacity)
+    problem, pairs, decision, pair_scores = built
+
+
+    # Warm start: seed the solver with an earlier assignment (e.g. a solve with
+    # looser parameters) so it begins with an incumbent bound instead of from scratch.
+    warm = initial is not None
+    if warm:
+        for k, pair in enumerate(pairs):
+            decision[k].setInitialValue(1 if pair in initial else 0)
+
 
-    # Solve the problem
-    problem.solve(PULP_CBC_CMD(msg=0, timeLimit=time))
+    # Solve the problem. The in-memory HiGHS binding (highspy) passes the model
+    # to the solver directly, skipping the MPS write / subprocess fork / .sol
+    # read roundtrip of the _CMD solvers. The command-line solvers remain for
+    # warm starts (which the binding does not accept) and installs without highspy.
+    # A relative gap (e.g. gap=0.01 for 1%) lets the solver stop at a provably
+    # near-optimal incumbent instead of closing the last fraction of the tree.
+    if solver == "highs" and not warm and HiGHS(msg=0).available():
+        if threads is not None:
+            # HiGHS pins its global scheduler to the thread count of the first
+            # solve in the process; reset it so a new thread count takes effect.
+            import highspy
+            highspy.Highs().resetGlobalScheduler(False)
+        problem.solve(HiGHS(msg=0, timeLimit=time, threads=threads, gapRel=gap))
+    elif solver == "highs" and HiGHS_CMD(msg=0).available():
+        problem.solve(HiGHS_CMD(msg=0, timeLimit=time, warmStart=warm, threads=threads, gapRel=gap))
+    else:
+        problem.solve(PULP_CBC_CMD(msg=0, timeLimit=time, warmStart=warm, threads=threads, gapRel=gap))
 
 
-    # Solution
-    solution = {}
-    for i in mentee_choice.keys():
-        for j in mentor_choice.keys():
-            if decision[i, j].varValue == 1:
-                solution[(i, j)] = scores[(i,j)]
+    # Solution: read every varValue once, then pick the selected pairs by boolean index
+    values = np.fromiter((v.varValue or 0 for v in decision), dtype=np.int8, count=len(pairs))
+    solution = {pairs[k]: pair_scores[k] for k in np.nonzero(values == 1)[0]}
 
 
-    return problem.objective.value(), solution
\ No newline at end of file
+    return problem.objective.value(), solution